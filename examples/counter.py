@@ -6,7 +6,7 @@ from hV_Fonts import Font
 
 import time
 
-spi = SPI(0, 8_000_000, sck=Pin(18), mosi=Pin(19), miso=Pin(16))
+spi = SPI(0, 16_000_000, sck=Pin(18), mosi=Pin(19), miso=Pin(16))
 
 myScreen = Screen(
     #pico spi pins
@@ -30,4 +30,5 @@ while(1):
     myScreen.gText(10, 10, str(count))
     count += 1
     time.sleep(1)
-    myScreen.flush()
+    # text is redrawn solid at the same place, no need to keep the frame
+    myScreen.flush(retain=False)
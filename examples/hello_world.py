@@ -6,7 +6,7 @@ from hV_Fonts import Font
 
 import time
 
-spi = SPI(0, 8_000_000, sck=Pin(18), mosi=Pin(19), miso=Pin(16))
+spi = SPI(0, 16_000_000, sck=Pin(18), mosi=Pin(19), miso=Pin(16))
 
 myScreen = Screen(
     #pico spi pins
@@ -22,6 +22,9 @@ __licence__ = "CC BY-NC-SA 4.0 - Creative Commons Attribution-NonCommercial-Shar
 __version__ = "6.0.6"
 
 from machine import Pin
+from array import array
+import framebuf
+import micropython
 import time
 from hV_Fonts import *
 
@@ -36,6 +39,39 @@ class Colour:
     GRAY = 0b0111101111101111  # American-English variant for grey
 
 
+# @brief COG initial sequence, built once
+# index, data sent as is, wait for busy
+_COG_initialSequence = (
+    (0x00, b"\x00", True),  # Soft-reset
+    (0xe5, bytes([0x19 | 0x40]), False),  # IN Temperature: 25C
+    (0xe0, b"\x02", False),  # Activate Temperature
+    (0x00, bytes([0xcf | 0x10, 0x8d | 0x02]), False),  # PSR
+)
+
+
+# @brief Text positions kept by gText()
+# 3 bytes per pixel of the text cells, one position at most half of it
+_TEXT_CACHE_BYTES = 6144
+_TEXT_CACHE_SEEN = 16  # positions drawn once, waiting for a second draw
+
+
+# @brief Bit masks, bit t set or cleared
+_MASKS = bytes([1 << t for t in range(8)])
+_NMASKS = bytes([~(1 << t) & 0xff for t in range(8)])
+
+# @brief Bit reversal, bit j to bit 7 - j
+_REVERSE = bytes([sum([((i >> b) & 1) << (7 - b) for b in range(8)]) for i in range(256)])
+
+
+# @brief Frame-buffer utilities
+# Viper, at most four arguments
+
+@micropython.viper
+def _blitByte(buf: ptr8, z: int, bits: int, clear: int):
+    # Clear then set bits of one byte
+    buf[z] = (int(buf[z]) & (0xff ^ clear)) | bits
+
+
 # @brief Main class
 
 class Screen:
@@ -54,27 +90,15 @@ class Screen:
     _orientation = 0
     _font = Font.font_s
 
-    # COG registers
-    indexE5_data = [0x19]  # temperature
-    indexE0_data = [0x02]  # activate temperature
-    index00_data = [0xcf, 0x8d]  # PSR, constant
+    # COG registers, see _COG_initialSequence
     # index50_data goes here
 
-    # Utilities
-    def __bitSet(self, value, bit_index):
-        return value | (1 << bit_index)
-
-    def __bitClear(self, value, bit_index):
-        return value & ~(1 << bit_index)
-
-    def __bitRead(self, value, bit_index):
-        return value & (1 << bit_index)
-
     # SPI utilities
     def __waitBusy(self):
         # LOW = busy, HIGH = ready
+        # Short poll, ready detected within 200 us
         while (self.busy.value() != 1):
-            time.sleep(0.032)
+            time.sleep_us(200)
 
     def __sendCommand8(self, command):
         """
@@ -82,10 +106,8 @@ class Screen:
         """
         self.dc.value(0)  # DC Low = Command
         self.cs.value(0)  # CS Low = Select
-
-        time.sleep(0.050)
-        self._spi.write(bytearray([command]))
-        time.sleep(0.050)
+        self._commandBuffer[0] = command
+        self._spi.write(self._commandBuffer)
 
     def __sendIndexData(self, index, data, size):
         """
@@ -97,41 +119,51 @@ class Screen:
             print("...", end=" ")
         print()
         """
-        self.dc.value(0)  # DC Low = Command
         self.cs.value(0)  # CS Low = Select
-
-        time.sleep(0.050)
-        self._spi.write(bytearray([index]))
-        time.sleep(0.050)
-
+        self.__writeIndexData(index, data)
         self.cs.value(1)  # CS High = Unselect
-        self.dc.value(1)  # DC High = Data
-        self.cs.value(0)  # CS Low = Select
 
-        time.sleep(0.050)
-        self._spi.write(bytearray(data))
-        time.sleep(0.050)
+    def __writeIndexData(self, index, data):
+        # CS already low
+        self._commandBuffer[0] = index
 
-        self.cs.value(1)  # CS High = Unselect
+        self.dc.value(0)  # DC Low = Command
+        self._spi.write(self._commandBuffer)
+
+        self.dc.value(1)  # DC High = Data
+        # Any buffer, sent as is in one write, not copied nor split,
+        # so the port can hand whole frames to DMA
+        self._spi.write(data)
 
     # COG utilities
     def __COG_initial(self):
         # New algorithm
-        self.__sendIndexData(0x00, [0x00], 1)  # Soft-reset
-        self.__waitBusy()
-
-        # Temperature settings
-        self.__sendIndexData(0xe5, [0x19 | 0x40], 1)  # IN Temperature: 25C
-        self.__sendIndexData(0xe0, [0x02], 1)  # Activate Temperature
-        self.__sendIndexData(0x00, [0xcf | 0x10, 0x8d | 0x02], 2)  # PSR
+        # Soft-reset, then temperature settings and PSR
+        for (index, data, wait) in _COG_initialSequence:
+            self.__sendIndexData(index, data, len(data))
+            if (wait):
+                self.__waitBusy()
         # _flag50a goes here
 
-    def __COG_sendImageDataFast(self):
-        self.__sendIndexData(0x10, self._oldImage,
-                             self._pageColourSize)  # Previous frame
-        self.__sendIndexData(0x13, self._newImage,
-                             self._pageColourSize)  # Next frame
-        self._oldImage[:] = self._newImage  # Copy displayed next to previous
+    def __COG_sendImageDataFast(self, retain):
+        # Both frames in one transaction, CS held low
+        self.cs.value(0)  # CS Low = Select
+        self.__writeIndexData(0x10, self._oldImage)  # Previous frame
+        self.__writeIndexData(0x13, self._newImage)  # Next frame
+        self.cs.value(1)  # CS High = Unselect
+
+        # Displayed next becomes previous, swap halves instead of copy
+        (self._oldImage, self._newImage) = (self._newImage, self._oldImage)
+        (self._oldFrameBuffer, self._newFrameBuffer) = (self._newFrameBuffer, self._oldFrameBuffer)
+
+        # Keep drawing on displayed frame, copy deferred to next drawing
+        # and dropped by clear()
+        self._copyPending = retain
+
+    def __copyFrame(self):
+        # Deferred copy from flush(retain=True)
+        self._newImage[:] = self._oldImage
+        self._copyPending = False
 
     def __COG_update(self):
         # _flag50b goes here
@@ -157,6 +189,7 @@ class Screen:
         self.reset = Pin(reset, Pin.OUT)
         self.dc =  Pin(dc, Pin.OUT)
         self.busy =  Pin(busy, Pin.IN)
+        self._commandBuffer = bytearray(1)  # Reused for command and index bytes
 
         self._screenSizeV = screenW
         self._screenSizeH = screenH
@@ -167,8 +200,28 @@ class Screen:
         self._bufferSizeV = self._screenSizeV  # vertical = wide size
         self._bufferSizeH = (self._screenSizeH >> 3)  # horizontal = small size 112 / 8
         self._pageColourSize = self._bufferSizeV * self._bufferSizeH
-        self._newImage = bytearray(self._pageColourSize)  # Next
-        self._oldImage = bytearray(self._pageColourSize)  # Previous
+        # Previous and next frames, one allocation viewed as two halves
+        self._frames = bytearray(2 * self._pageColourSize)
+        self._oldImage = memoryview(self._frames)[:self._pageColourSize]  # Previous
+        self._newImage = memoryview(self._frames)[self._pageColourSize:]  # Next
+
+        # C drawing primitives over each half
+        # frame-buffer x = physical y, frame-buffer y = physical x
+        self._oldFrameBuffer = framebuf.FrameBuffer(
+            self._oldImage, self._bufferSizeH * 8, self._bufferSizeV, framebuf.MONO_HLSB)
+        self._newFrameBuffer = framebuf.FrameBuffer(
+            self._newImage, self._bufferSizeH * 8, self._bufferSizeV, framebuf.MONO_HLSB)
+        self._frameDisplayed = False  # Until first flush, panel content unknown
+        self._dirty = True  # Drawn since last flush, first flush required
+        self._copyPending = False  # Displayed frame not yet copied to next
+
+        # Grey pattern for clear(), one even row 0b10101010 then one odd row 0b01010101
+        self._greyPair = (b"\xaa" * self._bufferSizeH) + (b"\x55" * self._bufferSizeH)
+
+        self.__setOrientCoordinates()
+
+        # Glyph table, so that text can be drawn before begin()
+        self.selectFont(self._fontSize)
 
     def __del__(self):
         pass
@@ -190,39 +243,55 @@ class Screen:
         # Font and touch
         self.selectFont(0)
 
-    def flush(self):
+    def flush(self, retain=True):
+        # retain = True: next frame starts from the displayed one
+        # retain = False: next frame starts from the frame before, for
+        # callers redrawing every changed area
+
+        # Nothing drawn since last flush
+        if (not self._dirty):
+            return
+
+        # Nothing to update, previous frame already displayed
+        if ((self._frameDisplayed) and (self._newImage == self._oldImage)):
+            self._dirty = False
+            return
+
         # Configure
         self.__COG_initial()
 
         # Send image data
-        self.__COG_sendImageDataFast()
+        self.__COG_sendImageDataFast(retain)
 
         # Update
         self.__COG_update()
         self.__COG_powerOff()
+        self._frameDisplayed = True
+        self._dirty = False
 
     def clear(self, colour=Colour.WHITE):
+        self._dirty = True
+        self._copyPending = False  # Whole frame redrawn
+
         if (colour == Colour.GREY):
-            for i in range(self._bufferSizeV):
-                if ((i % 2) == 0):
-                    pattern = 0b10101010
-                else:
-                    pattern = 0b01010101
+            # One slice copy per pair of rows
+            image = self._newImage
+            pair = self._greyPair
+            size = 2 * self._bufferSizeH
+            for z in range(0, self._pageColourSize - size + 1, size):
+                image[z:z + size] = pair
 
-                for j in range(self._bufferSizeH):
-                    self._newImage[i * self._bufferSizeH + j] = pattern
+            if (self._bufferSizeV % 2):
+                # Odd number of rows, last one even
+                image[self._pageColourSize - self._bufferSizeH:] = pair[:self._bufferSizeH]
 
         elif ((colour == Colour.WHITE) ^ self._invert):
             # physical black 00
-            for i in range(self._bufferSizeV):
-                for j in range(self._bufferSizeH):
-                    self._newImage[i * self._bufferSizeH + j] = 0x00
+            self._newFrameBuffer.fill(0)
 
         else:
             # physical white 10
-            for i in range(self._bufferSizeV):
-                for j in range(self._bufferSizeH):
-                    self._newImage[i * self._bufferSizeH + j] = 0xff
+            self._newFrameBuffer.fill(1)
 
     def regenerate(self):
         self.clear(Colour.BLACK)
@@ -236,20 +305,23 @@ class Screen:
     def invert(self, flag):
         self._invert = flag
 
+    @micropython.native
     def point(self, x1, y1, colour):
         # Orient and check coordinates are within screen
-        # _orientCoordinates() returns false = success, true = error
-        (flag, x1, y1) = self.__orientCoordinates(x1, y1)
+        # _orientCoords() returns false = success, true = error
+        (flag, z1, t1) = self._orientCoords(x1, y1)
         if (flag):
             return 0
 
-        (z1, t1) = self.__getZT(x1, y1)
+        if (self._copyPending):
+            self.__copyFrame()
+        self._dirty = True
 
         # Convert combined colours into basic colours
-        flagOdd = ((x1 + y1) % 2 == 0)
-
         if (colour == Colour.GREY):
-            if (flagOdd):
+            # Same parity as physical coordinates
+            (x1, y1) = self._frameCoords(x1, y1)
+            if ((x1 + y1) % 2 == 0):
                 colour = Colour.BLACK  # black
             else:
                 colour = Colour.WHITE  # white
@@ -257,13 +329,11 @@ class Screen:
         # Basic colours
         if ((colour == Colour.WHITE) ^ self._invert):
             # physical black 00
-            self._newImage[z1] = self.__bitClear(
-                self._newImage[z1], t1)
+            self._newImage[z1] &= _NMASKS[t1]
 
         elif ((colour == Colour.BLACK) ^ self._invert):
             # physical white 10
-            self._newImage[z1] = self.__bitSet(
-                self._newImage[z1], t1)
+            self._newImage[z1] |= _MASKS[t1]
 
     def setOrientation(self, orientation):
         if (orientation == 6):
@@ -277,40 +347,68 @@ class Screen:
                 self._orientation = 1
 
         self._orientation = orientation % 4
+        self.__setOrientCoordinates()
 
     def getOrientation(self):
         return self._orientation
 
-    def __orientCoordinates(self, x, y):
-        flag = True  # false = success, true = error
-
-        if (self._orientation == 3):  # checked, previously 1
-
-            if ((x < self._screenSizeV) and (y < self._screenSizeH)):
-                x = self._screenSizeV - 1 - x
-                flag = False
-
-        elif (self._orientation == 2):  # checked
-
-            if ((x < self._screenSizeH) and (y < self._screenSizeV)):
-                x = self._screenSizeH - 1 - x
-                y = self._screenSizeV - 1 - y
-                (y, x) = (x, y)  # swap
-                flag = False
-
-        elif (self._orientation == 1):  # checked, previously 3
-
-            if ((x < self._screenSizeV) and (y < self._screenSizeH)):
-                y = self._screenSizeH - 1 - y
-                flag = False
-
-        else:  # checked
-
-            if ((x < self._screenSizeH) and (y < self._screenSizeV)):
-                (y, x) = (x, y)  # swap
-                flag = False
-
-        return flag, x, y
+    def __setOrientCoordinates(self):
+        # One mapping per orientation, selected once
+        # Screen coordinates to frame-buffer coordinates, not checked
+        # frame-buffer x = physical y, frame-buffer y = physical x
+        sizeV = self._screenSizeV
+        sizeH = self._screenSizeH
+        maxV = sizeV - 1
+        maxH = sizeH - 1
+        bufferSizeH = self._bufferSizeH
+
+        def frame0(x, y):  # checked
+            return x, y
+
+        def frame1(x, y):  # checked, previously 3
+            return maxH - y, x
+
+        def frame2(x, y):  # checked
+            return maxH - x, maxV - y
+
+        def frame3(x, y):  # checked, previously 1
+            return y, maxV - x
+
+        frame = (frame0, frame1, frame2, frame3)[self._orientation]
+        self._frameCoords = frame
+
+        # Same mappings inlined with the bounds check, one call per pixel
+        # Returns flag, z, t with flag false = success, true = error
+        def orient0(x, y):  # checked
+            if ((0 <= x < sizeH) and (0 <= y < sizeV)):
+                # swap
+                return False, y * bufferSizeH + (x >> 3), 7 - (x & 7)
+            return True, 0, 0
+
+        def orient1(x, y):  # checked, previously 3
+            if ((0 <= x < sizeV) and (0 <= y < sizeH)):
+                y = maxH - y
+                return False, x * bufferSizeH + (y >> 3), 7 - (y & 7)
+            return True, 0, 0
+
+        def orient2(x, y):  # checked
+            if ((0 <= x < sizeH) and (0 <= y < sizeV)):
+                x = maxH - x
+                y = maxV - y
+                # swap
+                return False, y * bufferSizeH + (x >> 3), 7 - (x & 7)
+            return True, 0, 0
+
+        def orient3(x, y):  # checked, previously 1
+            if ((0 <= x < sizeV) and (0 <= y < sizeH)):
+                x = maxV - x
+                return False, x * bufferSizeH + (y >> 3), 7 - (y & 7)
+            return True, 0, 0
+
+        self._orientCoords = (orient0, orient1, orient2, orient3)[self._orientation]
+
+        # Text positions depend on orientation
+        self.__resetTextCache()
 
     def screenSizeX(self):
         if ((self._orientation == 1) or (self._orientation == 3)):
@@ -340,28 +438,112 @@ class Screen:
 
     def readPixel(self, x1, y1):
         # Orient and check coordinates are within screen
-        # _orientCoordinates() returns false = success, true = error
-        (flag, x1, y1) = self.__orientCoordinates(x1, y1)
+        # _orientCoords() returns false = success, true = error
+        (flag, z1, t1) = self._orientCoords(x1, y1)
         if (flag):
             return 0
 
-        result = 0
-        value(0)
+        if (self._copyPending):
+            self.__copyFrame()
+
+        # Same convention as point()
+        if (((self._newImage[z1] & _MASKS[t1]) > 0) ^ self._invert):
+            return Colour.BLACK
+
+        else:
+            return Colour.WHITE
 
-        (z1, t1) = self.__getZT(x1, y1)
+    def __colourBit(self, colour):
+        # Frame-buffer bit for black and white, None = nothing drawn
+        if ((colour == Colour.WHITE) ^ self._invert):
+            return 0  # physical black 00
 
-        value = self.__bitRead(self._newImage[z1], t1)
-        value <<= 4
-        value &= 0b11110000
+        elif ((colour == Colour.BLACK) ^ self._invert):
+            return 1  # physical white 10
 
-        # red = 0-1, black = 1-0, white 0-0
-        if (value == 0x10):
-            result = Colour.BLACK
+        return None
 
+    def __greyPattern(self, x1):
+        # Grey byte value for physical row x1
+        if ((x1 % 2) == 0):
+            pattern = 0b10101010
         else:
-            result = Colour.WHITE
+            pattern = 0b01010101
+
+        if (self._invert):
+            pattern ^= 0xff
+        return pattern
+
+    def __greyRow(self, x1, y1, y2):
+        # Physical row x1, from y1 to y2 included, byte-wise
+        y1 = max(y1, 0)
+        y2 = min(y2, self._screenSizeH - 1)
+        if ((x1 < 0) or (x1 >= self._screenSizeV) or (y1 > y2)):
+            return
+
+        pattern = self.__greyPattern(x1)
+        (zStart, tStart) = self.__getZT(x1, y1)
+        (zEnd, tEnd) = self.__getZT(x1, y2)
+        headMask = (0xff >> (7 - tStart))
+        tailMask = (0xff << tEnd) & 0xff
+
+        if (zStart == zEnd):
+            mask = headMask & tailMask
+            self._newImage[zStart] = (self._newImage[zStart] & ~mask) | (pattern & mask)
+
+        else:
+            self._newImage[zStart] = (self._newImage[zStart] & ~headMask) | (pattern & headMask)
+            self._newImage[zStart + 1:zEnd] = bytes([pattern]) * (zEnd - zStart - 1)
+            self._newImage[zEnd] = (self._newImage[zEnd] & ~tailMask) | (pattern & tailMask)
+
+    def __greyColumn(self, y1, x1, x2):
+        # Physical column y1, from x1 to x2 included, one bit per row
+        x1 = max(x1, 0)
+        x2 = min(x2, self._screenSizeV - 1)
+        if ((y1 < 0) or (y1 >= self._screenSizeH) or (x1 > x2)):
+            return
+
+        (zStart, t1) = self.__getZT(x1, y1)
+        zEnd = zStart + (x2 - x1) * self._bufferSizeH
+        mask = _MASKS[t1]
+
+        # Rows of same parity share the same value, grey alternates
+        for x in (x1, x1 + 1):
+            if (x > x2):
+                continue
+
+            image = self._newImage
+            first = zStart + (x - x1) * self._bufferSizeH
+            stride = 2 * self._bufferSizeH
+            if (self.__greyPattern(x) & mask):
+                for z in range(first, zEnd + 1, stride):
+                    image[z] |= mask
+            else:
+                keep = _NMASKS[t1]
+                for z in range(first, zEnd + 1, stride):
+                    image[z] &= keep
+
+    def __span(self, x1, y1, x2, y2, colour):
+        # Horizontal or vertical line in screen coordinates
+        (x1, y1) = self._frameCoords(x1, y1)
+        (x2, y2) = self._frameCoords(x2, y2)
+
+        if (colour != Colour.GREY):
+            bit = self.__colourBit(colour)
+            if (bit is None):
+                return
+
+            if (y1 == y2):
+                self._newFrameBuffer.hline(min(x1, x2), y1, abs(x2 - x1) + 1, bit)
+            else:
+                self._newFrameBuffer.vline(x1, min(y1, y2), abs(y2 - y1) + 1, bit)
+
+        # Grey, physical x = frame-buffer y, physical y = frame-buffer x
+        elif (y1 == y2):
+            self.__greyRow(y1, min(x1, x2), max(x1, x2))
 
-        return result
+        else:
+            self.__greyColumn(x1, min(y1, y2), max(y1, y2))
 
     def circle(self, x0, y0, radius, colour):
         f = 1 - radius
@@ -369,13 +551,14 @@ class Screen:
         ddF_y = -2 * radius
         x = 0
         y = radius
+        point = self.point
+        line = self.line
 
-        if (self.
-                _penSolid == False):
-            self.point(x0, y0 + radius, colour)
-            self.point(x0, y0 - radius, colour)
-            self.point(x0 + radius, y0, colour)
-            self.point(x0 - radius, y0, colour)
+        if (self._penSolid == False):
+            point(x0, y0 + radius, colour)
+            point(x0, y0 - radius, colour)
+            point(x0 + radius, y0, colour)
+            point(x0 - radius, y0, colour)
 
             while (x < y):
                 if (f >= 0):
@@ -387,14 +570,14 @@ class Screen:
                 ddF_x += 2
                 f += ddF_x
 
-                self.point(x0 + x, y0 + y, colour)
-                self.point(x0 - x, y0 + y, colour)
-                self.point(x0 + x, y0 - y, colour)
-                self.point(x0 - x, y0 - y, colour)
-                self.point(x0 + y, y0 + x, colour)
-                self.point(x0 - y, y0 + x, colour)
-                self.point(x0 + y, y0 - x, colour)
-                self.point(x0 - y, y0 - x, colour)
+                point(x0 + x, y0 + y, colour)
+                point(x0 - x, y0 + y, colour)
+                point(x0 + x, y0 - y, colour)
+                point(x0 - x, y0 - y, colour)
+                point(x0 + y, y0 + x, colour)
+                point(x0 - y, y0 + x, colour)
+                point(x0 + y, y0 - x, colour)
+                point(x0 - y, y0 - x, colour)
         else:
             while (x < y):
                 if (f >= 0):
@@ -406,10 +589,10 @@ class Screen:
                 ddF_x += 2
                 f += ddF_x
 
-                self.line(x0 + x, y0 + y, x0 - x, y0 + y, colour)  # bottom
-                self.line(x0 + x, y0 - y, x0 - x, y0 - y, colour)  # top
-                self.line(x0 + y, y0 - x, x0 + y, y0 + x, colour)  # right
-                self.line(x0 - y, y0 - x, x0 - y, y0 + x, colour)  # left
+                line(x0 + x, y0 + y, x0 - x, y0 + y, colour)  # bottom
+                line(x0 + x, y0 - y, x0 - x, y0 - y, colour)  # top
+                line(x0 + y, y0 - x, x0 + y, y0 + x, colour)  # right
+                line(x0 - y, y0 - x, x0 - y, y0 + x, colour)  # left
 
             self.setPenSolid(True)
             self.rectangle(x0 - x, y0 - y, x0 + x, y0 + y, colour)
@@ -418,6 +601,10 @@ class Screen:
         self.line(x0, y0, x0 + dx - 1, y0 + dy - 1, colour)
 
     def line(self, x1, y1, x2, y2, colour):
+        if (self._copyPending):
+            self.__copyFrame()
+        self._dirty = True
+
         if ((x1 == x2) and (y1 == y2)):
             self.point(x1, y1, colour)
 
@@ -425,15 +612,20 @@ class Screen:
             if (y1 > y2):
                 (y2, y1) = (y1, y2)  # swap
 
-            for y in range(y1, y2+1):
-                self.point(x1, y, colour)
+            self.__span(x1, y1, x1, y2, colour)
 
         elif (y1 == y2):
             if (x1 > x2):
                 (x2, x1) = (x1, x2)  # swap
 
-            for x in range(x1, x2+1):
-                self.point(x, y1, colour)
+            self.__span(x1, y1, x2, y1, colour)
+
+        elif (colour != Colour.GREY):
+            bit = self.__colourBit(colour)
+            if (bit is not None):
+                (fx1, fy1) = self._frameCoords(x1, y1)
+                (fx2, fy2) = self._frameCoords(x2, y2)
+                self._newFrameBuffer.line(fx1, fy1, fx2, fy2, bit)
 
         else:
             wx1 = x1
@@ -459,11 +651,12 @@ class Screen:
             else:
                 ystep = -1
 
+            point = self.point
             while (wx1 <= wx2):
                 if (flag):
-                    self.point(wy1, wx1, colour)
+                    point(wy1, wx1, colour)
                 else:
-                    self.point(wx1, wy1, colour)
+                    point(wx1, wy1, colour)
 
                 err -= dy
                 if (err < 0):
@@ -473,6 +666,10 @@ class Screen:
                 wx1 += 1
 
     def rectangle(self, x1, y1, x2, y2, colour):
+        if (self._copyPending):
+            self.__copyFrame()
+        self._dirty = True
+
         if (self._penSolid == False):
             self.line(x1, y1, x1, y2, colour)
             self.line(x1, y1, x2, y1, colour)
@@ -486,13 +683,28 @@ class Screen:
             if (y1 > y2):
                 (y2, y1) = (y1, y2)  # swap
 
-            for x in range(x1, x2+1):
+            if (colour != Colour.GREY):
+                bit = self.__colourBit(colour)
+                if (bit is not None):
+                    (fx1, fy1) = self._frameCoords(x1, y1)
+                    (fx2, fy2) = self._frameCoords(x2, y2)
+                    self._newFrameBuffer.fill_rect(min(fx1, fx2), min(fy1, fy2),
+                                                   abs(fx2 - fx1) + 1, abs(fy2 - fy1) + 1, bit)
+
+            # Grey, one span per physical row = same frame-buffer y
+            elif (self._frameCoords(x1, y1)[1] == self._frameCoords(x2, y1)[1]):
                 for y in range(y1, y2+1):
-                    self.point(x, y, colour)
+                    self.__span(x1, y, x2, y, colour)
+            else:
+                for x in range(x1, x2+1):
+                    self.__span(x, y1, x, y2, colour)
 
     def dRectangle(self, x0, y0, dx, dy, colour):
         self.rectangle(x0, y0, x0 + dx - 1, y0 + dy - 1, colour)
 
+    def setPenSolid(self, flag):
+        self._penSolid = flag
+
     # Font functions
     def setFontSolid(self, flag):
         self._fontSolid = flag
@@ -532,6 +744,34 @@ class Screen:
             self._font.first = 32
             self._font.number = 224
 
+        self.__buildGlyphs()
+
+    def __buildGlyphs(self):
+        # Copy the selected font into one flat table, bits in frame-buffer
+        # order: font bit j becomes bit 7 - j
+        font = (Font._Terminal6x8e,
+                Font._Terminal8x12e,
+                Font._Terminal12x16e)[self._fontSize]
+        # Font._Terminal16x24e not available
+
+        self._glyphWidth = self._font.maxWidth  # columns per character, per instance
+        self._glyphRows = (self._font.height + 7) >> 3  # bytes per column
+        self._glyphStride = self._glyphWidth * self._glyphRows  # bytes per character
+        self._glyphs = bytearray(len(font) * self._glyphStride)
+
+        z = 0
+        for character in font:
+            for line in character:
+                self._glyphs[z] = _REVERSE[line]
+                z += 1
+
+        # Background limited to font height, per column byte
+        self._glyphMasks = bytes(
+            [(0xff << (8 - min(8, self._font.height - 8 * r))) & 0xff for r in range(self._glyphRows)])
+
+        # Text positions depend on font size
+        self.__resetTextCache()
+
     def getFont(self):
         return self._fontSize
 
@@ -561,98 +801,206 @@ class Screen:
     def setFontSpaceY(self, number):
         self_fontSpaceY = number
 
-    def __getCharacter(self, character, index):
-        if (self._fontSize == 0):
-            return Font._Terminal6x8e[character][index]
-
-        elif (self._fontSize == 1):
-            return Font._Terminal8x12e[character][index]
-
-        elif (self._fontSize == 2):
-            return Font._Terminal12x16e[character][index]
-
-#         elif (self._fontSize == 3):
-#             return Font._Terminal16x24e[character][index]
-
+    @micropython.native
+    def __gTextFast(self, x0, y0, text, textColour, backColour):
+        # Orientations 1 and 3 with y0 on a byte boundary only:
+        # each font column byte then maps onto one frame-buffer byte
+        width = self._glyphWidth
+        rows = self._glyphRows
+        stride = self._glyphStride
+        glyphs = self._glyphs
+        masks = self._glyphMasks
+        reverse = _REVERSE
+        image = self._newImage
+        bufferSizeH = self._bufferSizeH
+        sizeV = self._screenSizeV
+        solid = self._fontSolid
+        flip = (self._orientation == 3)
+        textSet = (textColour == Colour.BLACK) ^ self._invert
+        backSet = (backColour == Colour.BLACK) ^ self._invert
+        space = ord(" ")
+
+        # Column bytes fully within screen, the others are skipped
+        visible = min(rows, (self._screenSizeH - y0) >> 3)
+
+        if (flip):
+            # physical y = y0 + j, bit 7 - j, byte order ascending
+            z0 = (y0 >> 3)
+            step = 1
         else:
-            return 0
+            # physical y = screenSizeH - 1 - y0 - j, bit j, byte order descending
+            z0 = ((self._screenSizeH - 1 - y0) >> 3)
+            step = -1
+
+        textLength = len(text)
+        for k in range(0, textLength):
+            c = (ord(text[k]) - space) * stride
+
+            for i in range(0, width):
+                x = x0 + width * k + i
+                if ((x < 0) or (x >= sizeV)):
+                    continue
+
+                if (flip):
+                    x = sizeV - 1 - x
+
+                z = x * bufferSizeH + z0
+                for r in range(0, visible):
+                    line = glyphs[c + rows * i + r]
+                    if (solid):
+                        back = ~line & masks[r]
+                    else:
+                        back = 0
+
+                    if (not flip):
+                        line = reverse[line]
+                        back = reverse[back]
+
+                    # Text and background bits are disjoint
+                    if (textSet):
+                        bits = line
+                        clear = 0
+                    else:
+                        bits = 0
+                        clear = line
+
+                    if (backSet):
+                        bits |= back
+                    else:
+                        clear |= back
+
+                    _blitByte(image, z + step * r, bits, clear)
+
+    def __resetTextCache(self):
+        self._textCache = {}
+        self._textCacheBytes = 0
+        self._textSeen = set()
+
+    def __textOffsets(self, x0, y0, length):
+        # Frame-buffer byte z and bit t for each pixel of the text cells,
+        # same order as the glyph table, z = 0xffff when out of screen
+        # None = not cached, only positions drawn twice and small enough
+        key = (x0, y0, length)
+        if (key in self._textCache):
+            return self._textCache[key]
+
+        size = length * self._glyphWidth * self._glyphRows * 8
+        if (3 * size > _TEXT_CACHE_BYTES // 2):
+            return None
+
+        if (key not in self._textSeen):
+            if (len(self._textSeen) >= _TEXT_CACHE_SEEN):
+                self._textSeen = set()
+            self._textSeen.add(key)
+            return None
+
+        self._textSeen.discard(key)
+        if (self._textCacheBytes + 3 * size > _TEXT_CACHE_BYTES):
+            self._textCache = {}
+            self._textCacheBytes = 0
+
+        width = self._glyphWidth
+        rows = self._glyphRows
+        orientCoords = self._orientCoords
+        offsets = array("H", range(size))  # no temporary buffer
+        bits = bytearray(size)
+
+        n = 0
+        for x in range(x0, x0 + length * width):
+            for y in range(y0, y0 + 8 * rows):
+                (flag, z1, t1) = orientCoords(x, y)
+                if (flag):
+                    offsets[n] = 0xffff
+                else:
+                    offsets[n] = z1
+                    bits[n] = t1
+                n += 1
+
+        self._textCache[key] = (offsets, bits)
+        self._textCacheBytes += 3 * size
+        return offsets, bits
+
+    def __gTextCached(self, x0, y0, text, textColour, backColour, cached):
+        # Black and white, positions computed once per place on screen
+        (offsets, bits) = cached
+
+        rows = self._glyphRows
+        stride = self._glyphStride
+        glyphs = self._glyphs
+        masks = self._glyphMasks
+        image = self._newImage
+        solid = self._fontSolid
+        textSet = (textColour == Colour.BLACK) ^ self._invert
+        backSet = (backColour == Colour.BLACK) ^ self._invert
+        space = ord(" ")
+
+        n = 0
+        textLength = len(text)
+        for k in range(0, textLength):
+            c = (ord(text[k]) - space) * stride
+
+            for index in range(c, c + stride):
+                line = glyphs[index]
+                back = masks[(index - c) % rows]
+
+                for j in range(0, 8):
+                    z = offsets[n]
+                    if (z != 0xffff):
+                        if (line & (0x80 >> j)):
+                            if (textSet):
+                                image[z] |= _MASKS[bits[n]]
+                            else:
+                                image[z] &= _NMASKS[bits[n]]
+
+                        elif ((solid) and (back & (0x80 >> j))):
+                            if (backSet):
+                                image[z] |= _MASKS[bits[n]]
+                            else:
+                                image[z] &= _NMASKS[bits[n]]
+                    n += 1
 
     def gText(self, x0, y0, text: str, textColour=Colour.BLACK, backColour=Colour.WHITE):
-        if (self._fontSize == 0):
-            for k in range(0, len(text)):
-                c = ord(text[k]) - ord(" ")
-
-                for i in range(0, 6):
-                    line = self.__getCharacter(c, i)
+        if (self._copyPending):
+            self.__copyFrame()
+        self._dirty = True
+
+        if ((textColour in (Colour.BLACK, Colour.WHITE))
+                and (backColour in (Colour.BLACK, Colour.WHITE))):
+            if ((y0 >= 0)
+                    and (((self._orientation == 3) and (y0 % 8 == 0))
+                         or ((self._orientation == 1) and ((self._screenSizeH - y0) % 8 == 0)))):
+                self.__gTextFast(x0, y0, text, textColour, backColour)
+                return
+
+            cached = self.__textOffsets(x0, y0, len(text))
+            if (cached is not None):
+                self.__gTextCached(x0, y0, text, textColour, backColour, cached)
+                return
+
+        # Grey, or position not cached, pixel by pixel
+        width = self._glyphWidth
+        rows = self._glyphRows
+        stride = self._glyphStride
+        glyphs = self._glyphs
+        masks = self._glyphMasks
+        solid = self._fontSolid
+        point = self.point
+        space = ord(" ")
+
+        textLength = len(text)
+        for k in range(0, textLength):
+            c = (ord(text[k]) - space) * stride
+
+            for i in range(0, width):
+                x = x0 + width * k + i
+
+                for r in range(0, rows):
+                    line = glyphs[c + rows * i + r]
+                    back = masks[r]
+                    y = y0 + 8 * r
 
                     for j in range(0, 8):
-                        if (self.__bitRead(line, j) > 0):
-                            self.point(x0 + 6 * k + i, y0 + j, textColour)
-                        elif (self._fontSolid):
-                            self.point(x0 + 6 * k + i, y0 + j, backColour)
-
-        elif (self._fontSize == 1):
-            for k in range(0, len(text)):
-                c = ord(text[k]) - ord(" ")
-
-                for i in range(0, 8):
-                    line = self.__getCharacter(c, 2 * i)
-                    line1 = self.__getCharacter(c, 2 * i + 1)
-
-                    for j in range(0, 8):
-                        if (self.__bitRead(line, j)):
-                            self.point(x0 + 8 * k + i, y0 + j, textColour)
-                        elif (self._fontSolid):
-                            self.point(x0 + 8 * k + i, y0 + j, backColour)
-
-                        if (self.__bitRead(line1, j)):
-                            self.point(x0 + 8 * k + i, y0 + 8 + j, textColour)
-                        elif ((self._fontSolid) and (j < 4)):
-                            self.point(x0 + 8 * k + i, y0 + 8 + j, backColour)
-
-        elif (self._fontSize == 2):
-            for k in range(0, len(text)):
-                c = ord(text[k]) - ord(" ")
-
-                for i in range(0, 12):
-                    line = self.__getCharacter(c, 2 * i)
-                    line1 = self.__getCharacter(c, 2 * i + 1)
-
-                    for j in range(0, 8):
-                        if (self.__bitRead(line, j)):
-                            self.point(x0 + 12 * k + i, y0 + j, textColour)
-                        elif (self._fontSolid):
-                            self.point(x0 + 12 * k + i, y0 + j, backColour)
-
-                        if (self.__bitRead(line1, j)):
-                            self.point(x0 + 12 * k + i, y0 + 8 + j, textColour)
-                        elif (self._fontSolid):
-                            self.point(x0 + 12 * k + i, y0 + 8 + j, backColour)
-
-#         elif (self._fontSize == 3):
-#             for k in range(0, len(text)):
-#                 c = ord(text[k]) - ord(" ")
-# 
-#                 for i in range(0, 16):
-#                     line = self.__getCharacter(c, 3 * i)
-#                     line1 = self.__getCharacter(c, 3 * i + 1)
-#                     line2 = self.__getCharacter(c, 3 * i + 2)
-# 
-#                     for j in range(0, 8):
-#                         if (self.__bitRead(line, j)):
-#                             self.point(x0 + 16 * k + i, y0 + j, textColour)
-#                         elif (self._fontSolid):
-#                             self.point(x0 + 16 * k + i, y0 + j, backColour)
-# 
-#                         if (self.__bitRead(line1, j)):
-#                             self.point(x0 + 16 * k + i, y0 + 8 + j, textColour)
-#                         elif (self._fontSolid):
-#                             self.point(x0 + 16 * k + i, y0 + 8 + j, backColour)
-# 
-#                         if (self.__bitRead(line2, j)):
-#                             self.point(x0 + 16 * k + i, y0 +
-#                                        16 + j, textColour)
-#                         elif (self._fontSolid):
-#                             self.point(x0 + 16 * k + i, y0 +
-#                                        16 + j, backColour)
-
+                        if (line & (0x80 >> j)):
+                            point(x, y + j, textColour)
+                        elif ((solid) and (back & (0x80 >> j))):
+                            point(x, y + j, backColour)